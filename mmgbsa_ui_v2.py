@@ -17,16 +17,31 @@ The app plots ΔGbind vs. time, shows running mean, and lets you download
 Each file is named automatically with the ligand ID.
 """
 
+import functools
+import hashlib
 import io
+import math
 import re
 from pathlib import Path
 import numpy as np
-from scipy import stats
+import bottleneck as bn
 
+import matplotlib as mpl
+mpl.use("Agg")  # Headless backend; must be selected before pyplot is imported
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import pandas as pd
 import streamlit as st
-import matplotlib as mpl
+
+try:
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional; falls back to the pandas C parser
+    pacsv = None
+
+try:
+    import xxhash
+except ImportError:  # Optional; falls back to hashlib.blake2b for cache keys
+    xxhash = None
 
 # ------------------------
 # Default settings
@@ -54,6 +69,14 @@ DEFAULT_SETTINGS = {
     "mean_legend_label": "Mean"
 }
 
+# Columns read from thermal_MMGBSA.csv; everything else is ignored
+CSV_COLUMNS = ["title", "r_psp_MMGBSA_dG_Bind"]
+
+# Bounds for the server-wide data caches: a few uploads' worth of results
+# (the comparison mode allows up to 6 ligands), dropped after an hour
+CACHE_MAX_ENTRIES = 24
+CACHE_TTL = "1h"
+
 # Color palette for comparison mode
 COLOR_PALETTE = [
     '#4E79A7', '#F28E2B', '#E15759', '#76B7B2', '#59A14F', '#EDC948',
@@ -80,27 +103,183 @@ def parse_ligand_id(title: str) -> str:
     return title if title else "Ligand"
 
 
-def compute_stats(series: pd.Series):
-    series = series.astype(float)
+def _read_mmgbsa(f):
+    """Read the MM-GBSA columns, preferring pyarrow's multithreaded CSV reader."""
+    dtype = {"r_psp_MMGBSA_dG_Bind": "float64"}
+    if pacsv is not None:
+        try:
+            convert_options = pacsv.ConvertOptions(include_columns=CSV_COLUMNS, column_types=dtype)
+            return pacsv.read_csv(f, convert_options=convert_options).to_pandas()
+        except (KeyError, ValueError):
+            # A column is absent (e.g. no title): let the C engine handle it
+            f.seek(0)
+    return pd.read_csv(f, usecols=lambda col: col in CSV_COLUMNS, dtype=dtype,
+                       engine="c", low_memory=False)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def _parse_csv(_data: bytes, digest: bytes) -> pd.DataFrame:
+    """Parse uploaded CSV bytes; cached on their digest so reruns don't re-read the file."""
+    return _read_mmgbsa(io.BytesIO(_data))
+
+
+def file_digest(raw: bytes) -> bytes:
+    """Cache key for uploaded file contents (cheaper than hashing the bytes per call)."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(raw)
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _get_fig(comparison: bool):
+    """Return this session's figure for the mode, creating it on first use.
+
+    Figures live in session state so concurrent sessions never draw into the
+    same axes; they are built outside pyplot so no global figure registry
+    keeps them alive.
+    """
+    figures = st.session_state.setdefault('figures', {})
+    if comparison not in figures:
+        fig = Figure(figsize=(10, 6) if comparison else (8, 4))
+        figures[comparison] = (fig, fig.add_subplot())
+    return figures[comparison]
+
+
+def _fig_png(fig, dpi=300) -> bytes:
+    """Render the figure to PNG bytes for download."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi)
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _default_ligand_settings(ids: tuple) -> dict:
+    """Default per-ligand plot settings, assigning palette colors in upload order."""
+    defaults = {}
+    for idx, ligand_id in enumerate(ids):
+        if ligand_id in defaults:
+            continue
+        color = COLOR_PALETTE[idx % len(COLOR_PALETTE)]
+        defaults[ligand_id] = {
+            'frame_color': color,
+            'frame_style': 'solid',
+            'running_mean_color': color,
+            'running_mean_style': 'solid',
+            'show_frames': False,  # Hide frame lines by default in comparison mode
+        }
+    return defaults
+
+
+def compute_stats(arr: np.ndarray):
+    # Expects the float64 column as parsed, so min/max are the values in the file
+    finite = arr[np.isfinite(arr)]
+    n = finite.size
+    if n == 0:
+        return {"frames": 0, "mean": np.nan, "stdev": np.nan, "minimum": np.nan, "maximum": np.nan}
+    s = finite.sum()
+    s2 = np.dot(finite, finite)
+    mean = s / n
+    var = max(s2 / n - mean * mean, 0.0)
     return {
-        "frames": int(series.count()),
-        "mean": series.mean(),
-        "stdev": series.std(),
-        "minimum": series.min(),
-        "maximum": series.max(),
+        "frames": int(n),
+        "mean": float(mean),
+        "stdev": math.sqrt(var * n / (n - 1)) if n > 1 else np.nan,
+        "minimum": float(finite.min()),
+        "maximum": float(finite.max()),
     }
 
 
+def rolling_std(arr: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation; NaN until two frames are in the window.
+
+    Accumulates in float64: bottleneck's float32 running sums lose most of the
+    precision for small windows of large, nearly equal values.
+    """
+    if window < 2:
+        return np.full(arr.shape, np.nan)
+    return bn.move_std(arr.astype(np.float64), window=window, min_count=2, ddof=1)
+
+
 def calculate_confidence_interval(data, confidence=0.95):
     """Calculate confidence interval for a series of data."""
+    from scipy import stats  # Deferred: scipy is slow to import and only needed for CIs
     mean = np.mean(data)
     std_err = stats.sem(data)
     ci = stats.t.interval(confidence, len(data)-1, loc=mean, scale=std_err)
     return mean, ci[0], ci[1]
 
 
-def plot_ligand_data(ax, time_ns, dg, running, settings, ligand_id, show_error_bars=False, yerr=None, ci_lower=None, ci_upper=None, color=None, frame_color=None, frame_style=None, running_style=None, show_frames=True, running_mean_width=None):
-    """Helper function to plot a single ligand's data."""
+def rolling_confidence_interval(arr: np.ndarray, window: int, confidence=0.95):
+    """Rolling confidence interval of the mean over a trailing window of frames.
+
+    The first two frames, and any window with fewer than two values, collapse
+    to the frame value itself.
+    """
+    from scipy import stats  # Deferred import, as in calculate_confidence_interval
+    mean = bn.move_mean(arr, window=window, min_count=1)
+    counts = bn.move_sum(np.isfinite(arr).astype(np.float32), window=window, min_count=1)
+    sem = rolling_std(arr, window) / np.sqrt(counts)
+    collapse = ~(counts >= 2)
+    collapse[:2] = True
+    # t quantile only for windows with >= 2 values; the rest are replaced below
+    tcrit = stats.t.ppf((1 + confidence) / 2, np.maximum(counts - 1, 1))
+    h = tcrit * sem
+    ci_lower = np.where(collapse, arr, mean - h)
+    ci_upper = np.where(collapse, arr, mean + h)
+    return ci_lower, ci_upper
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def _compute_derived(_raw: bytes, digest: bytes, window: int, err_type):
+    """Running mean, error bars and summary statistics for one uploaded file.
+
+    Cached on the file digest, window size and error type (None when error bars
+    are hidden), so style-only changes reuse the previous results.
+    """
+    df = _parse_csv(_raw, digest)
+    dg = df["r_psp_MMGBSA_dG_Bind"].to_numpy(dtype=np.float64)
+    # float32 is plenty for the rolling kernels and plotting; stats use float64
+    arr = dg.astype(np.float32)
+    # bottleneck needs window <= n
+    window = min(window, len(arr))
+    running = bn.move_mean(arr, window=window, min_count=1)
+    yerr = None
+    ci_lower = None
+    ci_upper = None
+    if err_type == "Standard Error":
+        running_count = bn.move_sum(np.isfinite(arr).astype(np.float32), window=window, min_count=1)
+        running_std = rolling_std(arr, window)
+        running_std /= np.sqrt(running_count)
+        yerr = np.nan_to_num(running_std, copy=False)
+    elif err_type == "Standard Deviation":
+        yerr = np.nan_to_num(rolling_std(arr, window), copy=False)
+    elif err_type == "95% Confidence Interval":
+        ci_lower, ci_upper = rolling_confidence_interval(arr, window)
+    return arr, running, yerr, ci_lower, ci_upper, compute_stats(dg)
+
+
+def _decimate(x, y, max_pts=2000):
+    """Min/max-decimate x/y to at most max_pts points for plotting.
+
+    Frames are split into buckets and each bucket keeps its lowest and highest
+    frame (in frame order), plus the first and last frames, so spikes and the
+    envelope of the trace survive decimation.
+    """
+    n = len(x)
+    if n <= max_pts:
+        return x, y
+    size = -(-n // ((max_pts - 2) // 2))  # frames per bucket (ceil)
+    pad = -n % size
+    buckets = np.concatenate([y, np.full(pad, np.nan)]).reshape(-1, size)
+    missing = np.isnan(buckets)
+    offsets = np.arange(0, n + pad, size)
+    lo = np.where(missing, np.inf, buckets).argmin(axis=1) + offsets
+    hi = np.where(missing, -np.inf, buckets).argmax(axis=1) + offsets
+    idx = np.unique(np.concatenate([[0, n - 1], lo, hi]))
+    return x[idx], y[idx]
+
+
+def plot_ligand_data(ax, time_ns, dg_arr, running_arr, settings, ligand_id, show_error_bars=False, yerr=None, ci_lower=None, ci_upper=None, color=None, frame_color=None, frame_style=None, running_style=None, show_frames=True, running_mean_width=None):
+    """Helper function to plot a single ligand's data (all series as ndarrays)."""
     frame_color = frame_color or settings['frame_color']
     running_color = color or settings['running_mean_color']
     running_mean_width = running_mean_width or settings['running_mean_width']
@@ -111,16 +290,19 @@ def plot_ligand_data(ax, time_ns, dg, running, settings, ligand_id, show_error_b
     frame_label = 'ΔGbind / frame'
     mean_label = f"{settings.get('window_size', 10)} - running mean"
     if show_frames:
+        # Per-frame trace is decimated for drawing; the running mean keeps full resolution
+        xd, yd = _decimate(time_ns, dg_arr)
         ax.plot(
-            time_ns, dg,
+            xd, yd,
             color=frame_color,
             alpha=settings['frame_alpha'],
             linestyle=frame_style,
             linewidth=frame_linewidth,
-            label=frame_label
+            label=frame_label,
+            rasterized=True  # Dense trace as one image in vector output; running mean stays vector
         )
     ax.plot(
-        time_ns, running,
+        time_ns, running_arr,
         color=running_color,
         linewidth=mean_linewidth,
         linestyle=running_style,
@@ -131,37 +313,31 @@ def plot_ligand_data(ax, time_ns, dg, running, settings, ligand_id, show_error_b
     # Add error bars if requested
     if settings['show_running_mean'] and show_error_bars:
         try:
-            x = np.array(time_ns)
-            y = running.values
+            x = time_ns
+            y = running_arr
+            # Zero-width (warm-up) and NaN bars are dropped; skip errorbar if none remain
             if settings['error_type'] == "Standard Error" or settings['error_type'] == "Standard Deviation":
-                yerr = np.array(yerr)
-                valid_mask = ~np.isnan(yerr)
-                if np.any(valid_mask):
-                    ax.errorbar(
-                        x[valid_mask],
-                        y[valid_mask],
-                        yerr=yerr[valid_mask],
-                        color=running_color,
-                        alpha=settings['error_alpha'],
-                        fmt='none',
-                        capsize=3,
-                        label=None
-                    )
+                valid_idx = np.flatnonzero(yerr > 0)
+                if valid_idx.size == 0:
+                    return
+                bars = yerr[valid_idx]
             else:
-                yerr_lower = np.abs(y - np.array(ci_lower))
-                yerr_upper = np.abs(np.array(ci_upper) - y)
-                valid_mask = ~np.isnan(yerr_lower) & ~np.isnan(yerr_upper)
-                if np.any(valid_mask):
-                    ax.errorbar(
-                        x[valid_mask],
-                        y[valid_mask],
-                        yerr=[yerr_lower[valid_mask], yerr_upper[valid_mask]],
-                        color=running_color,
-                        alpha=settings['error_alpha'],
-                        fmt='none',
-                        capsize=3,
-                        label=None
-                    )
+                yerr_lower = np.abs(y - ci_lower)
+                yerr_upper = np.abs(ci_upper - y)
+                valid_idx = np.flatnonzero((yerr_lower > 0) | (yerr_upper > 0))
+                if valid_idx.size == 0:
+                    return
+                bars = [yerr_lower[valid_idx], yerr_upper[valid_idx]]
+            ax.errorbar(
+                x[valid_idx],
+                y[valid_idx],
+                yerr=bars,
+                color=running_color,
+                alpha=settings['error_alpha'],
+                fmt='none',
+                capsize=3,
+                label=None
+            )
         except Exception as e:
             st.warning(f"Could not plot error bars for {ligand_id}: {str(e)}")
 
@@ -228,10 +404,11 @@ if comparison_mode:
     file_data = []
     for idx, csv_file in enumerate(uploaded_files):
         try:
-            csv_file.seek(0)
-            df = pd.read_csv(csv_file)
+            raw = csv_file.getvalue()
+            digest = file_digest(raw)
+            df = _parse_csv(raw, digest)
             ligand_id = parse_ligand_id(df.get("title", pd.Series(["Ligand"])).iloc[0])
-            file_data.append({'df': df, 'ligand_id': ligand_id, 'csv_file': csv_file})
+            file_data.append({'df': df, 'raw': raw, 'digest': digest, 'ligand_id': ligand_id, 'csv_file': csv_file})
         except Exception:
             ligand_id = f"Ligand_{idx+1}"
             file_data.append({'df': None, 'ligand_id': ligand_id, 'csv_file': csv_file})
@@ -241,10 +418,11 @@ else:
     file_data = []
     if csv_file:
         try:
-            csv_file.seek(0)
-            df = pd.read_csv(csv_file)
+            raw = csv_file.getvalue()
+            digest = file_digest(raw)
+            df = _parse_csv(raw, digest)
             ligand_id = parse_ligand_id(df.get("title", pd.Series(["Ligand"])).iloc[0])
-            file_data.append({'df': df, 'ligand_id': ligand_id, 'csv_file': csv_file})
+            file_data.append({'df': df, 'raw': raw, 'digest': digest, 'ligand_id': ligand_id, 'csv_file': csv_file})
             # Update plot title with ligand name when file is uploaded (single ligand mode)
             default_title_with_ligand = f"ΔGbind vs Time (ns) - {ligand_id}"
             if (st.session_state.settings['plot_title'] == "ΔGbind vs Time (ns)" or 
@@ -401,27 +579,15 @@ with st.sidebar:
 # Use settings from session state
 settings = st.session_state.settings
 
-md_length_ns = st.number_input("Total MD time (ns)", value=100, min_value=1)
-
 # --- Per-ligand settings in comparison mode ---
 if settings['comparison_mode'] and file_data:
     if 'ligand_settings' not in st.session_state:
         st.session_state.ligand_settings = {}
     ligand_settings = st.session_state.ligand_settings
-    ligand_ids = []
-    for idx, entry in enumerate(file_data):
-        ligand_id = entry['ligand_id']
-        ligand_ids.append(ligand_id)
-        # Assign palette color by default
-        default_color = COLOR_PALETTE[idx % len(COLOR_PALETTE)]
-        if ligand_id not in ligand_settings:
-            ligand_settings[ligand_id] = {
-                'frame_color': default_color,
-                'frame_style': 'solid',
-                'running_mean_color': default_color,
-                'running_mean_style': 'solid',
-                'show_frames': False,  # Hide frame lines by default in comparison mode
-            }
+    ligand_ids = [entry['ligand_id'] for entry in file_data]
+    # Palette defaults only for ligands the user hasn't customised yet
+    for ligand_id, defaults in _default_ligand_settings(tuple(ligand_ids)).items():
+        ligand_settings.setdefault(ligand_id, defaults)
     st.sidebar.subheader("Per-Ligand Plot Settings")
     for ligand_id in ligand_ids:
         with st.sidebar.expander(f"{ligand_id}"):
@@ -439,14 +605,21 @@ if settings['comparison_mode'] and file_data:
                 index=["solid", "dashed", "dotted", "dashdot"].index(ligand_settings[ligand_id]['running_mean_style']), key=f"running_style_{ligand_id}")
     st.session_state.ligand_settings = ligand_settings
 
-if file_data and md_length_ns > 0:
+# --- Plot, statistics and downloads ---
+# Runs as a fragment: widgets inside it (MD time, download buttons) rerun only
+# this block, not the upload/parse path above.
+@st.fragment
+def _plot_fragment(file_data):
+    settings = st.session_state.settings
+    md_length_ns = st.number_input("Total MD time (ns)", value=100, min_value=1)
+    if not (file_data and md_length_ns > 0):
+        st.info("Upload CSV file(s) and set the total simulation time to begin.")
+        return
     # Store data for comparison
     all_stats = []
-    # Create figure for plotting
-    if settings['comparison_mode']:
-        fig, ax = plt.subplots(figsize=(10, 6))
-    else:
-        fig, ax = plt.subplots(figsize=(8, 4))
+    # Reuse this session's figure for the mode, starting from empty axes
+    fig, ax = _get_fig(settings['comparison_mode'])
+    ax.clear()
     for entry in file_data:
         df = entry['df']
         ligand_id = entry['ligand_id']
@@ -456,7 +629,6 @@ if file_data and md_length_ns > 0:
         if "r_psp_MMGBSA_dG_Bind" not in df.columns:
             st.error(f"Column 'r_psp_MMGBSA_dG_Bind' not found in {entry['csv_file'].name}. Please check if this is a valid MMGBSA output file.")
             continue
-        dg = df["r_psp_MMGBSA_dG_Bind"].astype(float)
         # Use per-ligand settings if in comparison mode
         if settings['comparison_mode'] and 'ligand_settings' in st.session_state and ligand_id in st.session_state.ligand_settings:
             ligand_cfg = st.session_state.ligand_settings[ligand_id]
@@ -473,54 +645,26 @@ if file_data and md_length_ns > 0:
             running_color = settings['running_mean_color']
             running_style = settings['running_mean_style']
             show_frames = settings['show_frames']
+        # Running mean, error bars and statistics (cached per file and settings)
+        error_type = settings['error_type'] if settings['show_error_bars'] else None
+        dg_arr, running_arr, yerr, ci_lower, ci_upper, ligand_stats = _compute_derived(
+            entry['raw'], entry['digest'], settings['window_size'], error_type
+        )
         # Time axis in ns
-        dt = md_length_ns / max(len(dg) - 1, 1)
-        time_ns = [i * dt for i in range(len(dg))]
-        # Running mean with customizable window size
-        running = dg.rolling(window=settings['window_size'], min_periods=1).mean()
-        # Calculate error bars if requested
-        yerr = None
-        ci_lower = None
-        ci_upper = None
-        if settings['show_error_bars']:
-            if settings['error_type'] == "Standard Error":
-                running_std = dg.rolling(window=settings['window_size'], min_periods=2).std()
-                running_count = dg.rolling(window=settings['window_size'], min_periods=2).count()
-                running_std = running_std / np.sqrt(running_count)
-                yerr = running_std.fillna(0)
-            elif settings['error_type'] == "Standard Deviation":
-                running_std = dg.rolling(window=settings['window_size'], min_periods=2).std()
-                yerr = running_std.fillna(0)
-            else:  # 95% Confidence Interval
-                ci_lower = []
-                ci_upper = []
-                for i in range(len(dg)):
-                    if i < 2:
-                        ci_lower.append(dg.iloc[i])
-                        ci_upper.append(dg.iloc[i])
-                    else:
-                        window_data = dg.iloc[max(0, i-settings['window_size']+1):i+1]
-                        if len(window_data) >= 2:
-                            _, lower, upper = calculate_confidence_interval(window_data)
-                            ci_lower.append(lower)
-                            ci_upper.append(upper)
-                        else:
-                            ci_lower.append(dg.iloc[i])
-                            ci_upper.append(dg.iloc[i])
+        time_ns = np.linspace(0.0, md_length_ns, num=len(dg_arr), dtype=np.float32)
         # Plot the data with ligand-specific settings
         plot_ligand_data(
-            ax, time_ns, dg, running, settings, ligand_id,
+            ax, time_ns, dg_arr, running_arr, settings, ligand_id,
             settings['show_error_bars'], yerr, ci_lower, ci_upper,
             color=running_color, frame_color=frame_color, frame_style=frame_style, running_style=running_style, show_frames=show_frames, running_mean_width=settings['running_mean_width']
         )
         # Store statistics
-        stats = compute_stats(dg)
-        stats['ligand_id'] = ligand_id
-        all_stats.append(stats)
+        ligand_stats['ligand_id'] = ligand_id
+        all_stats.append(ligand_stats)
     # Only proceed with plotting if we have valid data
     if not all_stats:
         st.error("No valid data to plot. Please check your input files.")
-        st.stop()
+        return
     # Set plot properties
     ax.set_xlabel(st.session_state.settings['x_label'])
     ax.set_ylabel(st.session_state.settings['y_label'])
@@ -532,17 +676,16 @@ if file_data and md_length_ns > 0:
     fig.tight_layout()
 
     # Display plot
-    st.pyplot(fig, use_container_width=True)
+    st.pyplot(fig, width="stretch")
 
-    # PNG download
-    png_buf = io.BytesIO()
-    fig.savefig(png_buf, format="png", dpi=300)
-    png_buf.seek(0)
+    # PNG download, rendered only when the button is clicked. The click must not
+    # rerun the fragment: the callable renders this figure on another thread.
     st.download_button(
         label="Download PNG",
-        data=png_buf,
+        data=functools.partial(_fig_png, fig),
         file_name=f"mmgbsa_comparison.png" if settings['comparison_mode'] else f"{all_stats[0]['ligand_id']}_dg_time.png",
         mime="image/png",
+        on_click="ignore",
     )
 
     # Display comparison statistics
@@ -551,22 +694,22 @@ if file_data and md_length_ns > 0:
         # Create a comparison table
         comparison_data_display = []
         comparison_data_csv = []
-        for stats in all_stats:
+        for ligand_stats in all_stats:
             comparison_data_display.append({
-                "Ligand": stats['ligand_id'],
-                "Mean ΔGbind": f"{stats['mean']:.2f}",
-                "StdDev": f"{stats['stdev']:.2f}",
-                "Min (Best)": f"{stats['minimum']:.2f}",
-                "Max (Worst)": f"{stats['maximum']:.2f}",
-                "Frames": stats['frames']
+                "Ligand": ligand_stats['ligand_id'],
+                "Mean ΔGbind": f"{ligand_stats['mean']:.2f}",
+                "StdDev": f"{ligand_stats['stdev']:.2f}",
+                "Min (Best)": f"{ligand_stats['minimum']:.2f}",
+                "Max (Worst)": f"{ligand_stats['maximum']:.2f}",
+                "Frames": ligand_stats['frames']
             })
             comparison_data_csv.append({
-                "Ligand": stats['ligand_id'],
-                "Mean_dGbind": stats['mean'],
-                "StdDev": stats['stdev'],
-                "Min_Best": stats['minimum'],
-                "Max_Worst": stats['maximum'],
-                "Frames": stats['frames']
+                "Ligand": ligand_stats['ligand_id'],
+                "Mean_dGbind": ligand_stats['mean'],
+                "StdDev": ligand_stats['stdev'],
+                "Min_Best": ligand_stats['minimum'],
+                "Max_Worst": ligand_stats['maximum'],
+                "Frames": ligand_stats['frames']
             })
         df_stats_display = pd.DataFrame(comparison_data_display)
         df_stats_csv = pd.DataFrame(comparison_data_csv)
@@ -589,13 +732,13 @@ if file_data and md_length_ns > 0:
     if settings['comparison_mode']:
         txt_lines.append("MMGBSA Comparison Statistics")
         txt_lines.append("=" * 30)
-        for stats in all_stats:
+        for ligand_stats in all_stats:
             txt_lines.extend([
-                f"\nLigand: {stats['ligand_id']}",
-                f"Mean ΔGbind: {stats['mean']:.2f} kcal/mol",
-                f"StdDev: {stats['stdev']:.2f}",
-                f"Range: {stats['minimum']:.2f} to {stats['maximum']:.2f}",
-                f"Frames: {stats['frames']}",
+                f"\nLigand: {ligand_stats['ligand_id']}",
+                f"Mean ΔGbind: {ligand_stats['mean']:.2f} kcal/mol",
+                f"StdDev: {ligand_stats['stdev']:.2f}",
+                f"Range: {ligand_stats['minimum']:.2f} to {ligand_stats['maximum']:.2f}",
+                f"Frames: {ligand_stats['frames']}",
                 "-" * 30
             ])
     else:
@@ -619,5 +762,6 @@ if file_data and md_length_ns > 0:
         file_name=f"mmgbsa_comparison_stats.txt" if settings['comparison_mode'] else f"{all_stats[0]['ligand_id']}_dg_stats.txt",
         mime="text/plain",
     )
-else:
-    st.info("Upload CSV file(s) and set the total simulation time to begin.")
+
+
+_plot_fragment(file_data)
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from mmgbsa_ui_v2 import _decimate  # noqa: E402
+
+
+def test_decimate_keeps_spikes_and_endpoints():
+    rng = np.random.default_rng(0)
+    y = rng.normal(-80.0, 3.0, 10_000).astype(np.float32)
+    y[5001] = -120.0
+    x = np.linspace(0.0, 100.0, y.size, dtype=np.float32)
+    xd, yd = _decimate(x, y)
+    assert len(xd) <= 2000
+    assert yd.min() == y.min()
+    assert yd.max() == y.max()
+    assert xd[0] == x[0] and xd[-1] == x[-1]
+    assert np.all(np.diff(xd) > 0)
+
+
+def test_decimate_short_trace_unchanged():
+    x = np.arange(10.0)
+    xd, yd = _decimate(x, x)
+    assert xd is x and yd is x